@@ -12,7 +12,29 @@ OPTIONS = {
         'CFBundleVersion': '1.0.0',
         'CFBundleShortVersionString': '1.0.0',
     },
-    'packages': ['PIL', 'requests', 'bs4'],
+    'packages': ['requests', 'lxml', 'Quartz', 'AppKit', 'Foundation'],
+    # Only bundle the parts of Pillow we use instead of every format plugin
+    'includes': [
+        'PIL.Image',
+        'PIL.ImageDraw',
+        'PIL.ImageFont',
+        'PIL.JpegImagePlugin',
+        'PIL.PngImagePlugin',
+        'PIL.GifImagePlugin',
+    ],
+    'excludes': [
+        'PIL.WebPImagePlugin',
+        'PIL.BmpImagePlugin',
+        'PIL.PpmImagePlugin',
+        'PIL.EpsImagePlugin',
+        'PIL.IcnsImagePlugin',
+        'tkinter',
+        'test',
+        'unittest',
+        'pydoc',
+        'http.server',
+    ],
+    'optimize': 2,
 }
 
 setup(
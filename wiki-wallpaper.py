@@ -12,25 +12,88 @@ This script:
 import os
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import date
 import subprocess
 import tempfile
-from PIL import Image, ImageDraw, ImageFont
-from bs4 import BeautifulSoup
-import textwrap
-import io
+import concurrent.futures
+import functools
+import json
+import hashlib
+import shutil
+from urllib.parse import urlparse
 import re
-import time
-
-from openai import OpenAI
-
-# Set up a session for API requests
+import html
+
+# Quartz (pyobjc) reads the display mode directly, without system_profiler
+try:
+    import Quartz
+except ImportError:
+    Quartz = None
+
+# AppKit (pyobjc) sets the wallpaper in-process, without osascript
+try:
+    from AppKit import NSScreen, NSWorkspace
+    from Foundation import NSURL
+except ImportError:
+    NSWorkspace = None
+
+# Set a user agent to avoid blocking
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+
+# Set up a session shared by the API and image requests, so connections to
+# Wikipedia and upload.wikimedia.org are kept alive and reused. Transient
+# server errors are retried with backoff by urllib3.
 SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=(500, 502, 503, 504))
+))
 ENDPOINT = "https://en.wikipedia.org/w/api.php"
 
-def fetch_potd(current_date=None):
+# Patterns used on every run, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+RESOLUTION_RE = re.compile(r'Resolution:\s+(\d+)\s*x\s*(\d+)')
+# A caption runs until the next template parameter or the end of the template
+WIKITEXT_CAPTION_RE = re.compile(r'^[ \t]*\|[ \t]*(?:caption|description)[ \t]*=[ \t]*(.*?)\s*(?=\n\s*\||\n\s*\}\}|\Z)', re.MULTILINE | re.DOTALL | re.IGNORECASE)
+WIKILINK_RE = re.compile(r'\[\[(?:[^\]|]*\|)?([^\]|]*)\]\]')
+EXTLINK_RE = re.compile(r'\[(?:https?:)?//[^\s\]]+\s+([^\]]+)\]')
+
+def find_font_path():
+    """Return the first available system font for the description text."""
+    font_path = "/System/Library/Fonts/Supplemental/Arial.ttf"  # Default font path for macOS
+
+    # Try different system fonts if the default isn't available
+    if not os.path.exists(font_path):
+        font_paths = [
+            "/System/Library/Fonts/Helvetica.ttc",
+            "/Library/Fonts/Arial.ttf",
+            "/System/Library/Fonts/Supplemental/Courier New.ttf"
+        ]
+        for path in font_paths:
+            if os.path.exists(path):
+                font_path = path
+                break
+
+    return font_path
+
+# Font for the description text, looked up once
+FONT_PATH = find_font_path()
+FONT_SIZE = 22  # Slightly larger font for better readability
+
+# Caption used when the POTD description can't be fetched
+DEFAULT_DESCRIPTION = "Wikipedia Picture of the Day"
+
+# POTD metadata and downloaded images are cached per day
+CACHE_DIR = os.path.expanduser("~/Library/Caches/wikipedia-wallpaper")
+
+def fetch_potd(current_date=None, width=None):
     """
-    Returns image data related to the current POTD using MediaWiki API
+    Returns image data related to the current POTD using MediaWiki API.
+    If width is given, the image URL is for a thumbnail of that width.
     """
     if current_date is None:
         current_date = date.today()
@@ -38,208 +101,271 @@ def fetch_potd(current_date=None):
     date_iso = current_date.isoformat()
     title = "Template:POTD protected/" + date_iso
 
-    # First API call to get the image filename
+    # First API call to get the image on the template page and its URL
     params = {
         "action": "query",
         "format": "json",
         "formatversion": "2",
-        "prop": "images",
+        "generator": "images",
+        "prop": "imageinfo",
+        "iiprop": "url",
         "titles": title
     }
+    if width:
+        params["iiurlwidth"] = str(width)
 
     try:
-        response = SESSION.get(url=ENDPOINT, params=params)
-        data = response.json()
+        # The description only needs the date, so fetch it while we look up the image
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            description_future = executor.submit(fetch_image_description, date_iso)
 
-        # Check if we got valid data
-        if "query" not in data or "pages" not in data["query"] or not data["query"]["pages"]:
-            print(f"Error: Invalid API response for date {date_iso}")
-            return None, None
+            response = SESSION.get(url=ENDPOINT, params=params, timeout=10)
+            data = response.json()
 
-        # Get the filename from the response
-        if "images" not in data["query"]["pages"][0] or not data["query"]["pages"][0]["images"]:
-            print(f"Error: No images found for date {date_iso}")
-            return None, None
+            # Check if we got valid data; there are no pages when the template has no images
+            if "query" not in data or "pages" not in data["query"] or not data["query"]["pages"]:
+                print(f"Error: No images found for date {date_iso}")
+                return None, None
 
-        filename = data["query"]["pages"][0]["images"][0]["title"]
+            page = data["query"]["pages"][0]
+            filename = page["title"]
+            if "imageinfo" not in page or not page["imageinfo"]:
+                print(f"Error: No image info found for {filename}")
+                return None, None
 
-        # Second API call to get the image URL
-        image_url = fetch_image_src(filename)
+            image_info = page["imageinfo"][0]
+            # The thumbnail is absent for some non-raster files; use the original then
+            image_url = image_info.get("thumburl") or image_info["url"]
 
-        # Third API call to get the description
-        description = fetch_image_description(date_iso)
+            # Second API call to get the description, started above
+            description = description_future.result()
 
-        print(f"Successfully found POTD: {filename}")
+            print(f"Successfully found POTD: {filename}")
 
-        return image_url, description
+            return image_url, description
 
     except Exception as e:
         print(f"Error fetching POTD: {e}")
         return None, None
 
-def fetch_image_src(filename):
-    """
-    Returns the POTD's image url
-    """
-    params = {
-        "action": "query",
-        "format": "json",
-        "prop": "imageinfo",
-        "iiprop": "url",
-        "titles": filename
-    }
-
-    try:
-        response = SESSION.get(url=ENDPOINT, params=params)
-        data = response.json()
-
-        # Navigate through the response to get the URL
-        page = next(iter(data["query"]["pages"].values()))
-        if "imageinfo" not in page or not page["imageinfo"]:
-            print(f"Error: No image info found for {filename}")
-            return None
-
-        image_info = page["imageinfo"][0]
-        image_url = image_info["url"]
-
-        return image_url
-
-    except Exception as e:
-        print(f"Error fetching image URL: {e}")
-        return None
-
 def fetch_image_description(date_iso):
     """
     Get the description for the POTD
     """
-    # Get the description from the template page
+    # Get the description from the template page, both as wikitext and as
+    # rendered HTML so a miss on the wikitext doesn't cost another request
     params = {
         "action": "parse",
         "format": "json",
         "page": f"Template:POTD protected/{date_iso}",
-        "prop": "text"
+        "prop": "wikitext|text",
+        # Skip the parser limit report and edit links; we only want the content
+        "disablelimitreport": "1",
+        "disableeditsection": "1"
     }
 
     try:
-        response = SESSION.get(url=ENDPOINT, params=params)
+        response = SESSION.get(url=ENDPOINT, params=params, timeout=10)
         data = response.json()
 
         if "parse" not in data or "text" not in data["parse"]:
             print("Error: Could not parse description page")
-            return "Wikipedia Picture of the Day"
-
-        html_content = data["parse"]["text"]["*"]
-
-        # Parse the HTML to extract the description
-        soup = BeautifulSoup(html_content, 'html.parser')
+            return DEFAULT_DESCRIPTION
 
-        # Try to find the description in different possible locations
-        description = ""
-
-        # Method 1: Look for div with class 'description'
-        desc_div = soup.find('div', class_='description')
-        if desc_div:
-            description = desc_div.get_text().strip()
-
-        # Method 2: Look for the text after the image
+        # The caption is usually a plain template parameter, which is much
+        # cheaper to pick out of the wikitext than to parse the HTML for
+        description = description_from_wikitext(data["parse"].get("wikitext", {}).get("*", ""))
         if not description:
-            # Find all paragraphs
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                # Take the longest paragraph as it's likely the description
-                description = max(paragraphs, key=lambda p: len(p.get_text())).get_text().strip()
-
-        # Method 3: Just grab all the text
-        if not description:
-            description = soup.get_text().strip()
+            description = description_from_html(data["parse"]["text"]["*"])
 
         # Clean up the description
-        description = re.sub(r'\s+', ' ', description)  # Replace multiple spaces with single space
+        description = WHITESPACE_RE.sub(' ', description)  # Replace multiple spaces with single space
 
         if not description:
-            description = "Wikipedia Picture of the Day"
+            description = DEFAULT_DESCRIPTION
 
         return description
 
     except Exception as e:
         print(f"Error fetching description: {e}")
-        return "Wikipedia Picture of the Day"
+        return DEFAULT_DESCRIPTION
+
+def description_from_wikitext(wikitext):
+    """
+    Extract the caption parameter from the POTD template wikitext. Returns ""
+    if there is none, or if it uses markup beyond links, bold/italics and
+    character entities.
+    """
+    match = WIKITEXT_CAPTION_RE.search(wikitext)
+    # An empty caption must not pick up the parameter after it
+    if not match or not match.group(1) or match.group(1).startswith("|"):
+        return ""
+
+    # [[Target|label]] -> label, [[Target]] -> Target, [url label] -> label,
+    # then drop bold/italics
+    description = WIKILINK_RE.sub(r'\1', match.group(1))
+    description = EXTLINK_RE.sub(r'\1', description)
+    description = description.replace("'''", "").replace("''", "")
+
+    # Templates, references, other tags, unlabelled links and further
+    # parameters on the same line need the rendered HTML
+    if any(marker in description for marker in ("{{", "}}", "[", "<", "|")):
+        return ""
+
+    # &nbsp; -> non-breaking space, &ndash; -> en dash, and so on
+    return html.unescape(description).strip()
+
+def description_from_html(html_content):
+    """Extract the description from the rendered POTD template HTML."""
+    import lxml.html
+
+    # Parse the HTML to extract the description
+    root = lxml.html.fromstring(html_content)
+
+    # Try to find the description in different possible locations
+    description = ""
+
+    # Method 1: Look for div with class 'description'
+    desc_div = next((el for el in root.find_class('description') if el.tag == 'div'), None)
+    if desc_div is not None:
+        description = desc_div.text_content().strip()
+
+    # Method 2: Look for the text after the image
+    if not description:
+        # Take the longest paragraph as it's likely the description
+        description = max((p.text_content() for p in root.iter('p')), key=len, default="").strip()
+
+    # Method 3: Just grab all the text
+    if not description:
+        description = root.text_content().strip()
+
+    return description
+
+def load_cached_potd(date_iso):
+    """Return the cached (image_url, description) for the date, if any."""
+    cache_path = os.path.join(CACHE_DIR, f"{date_iso}.json")
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+        return data["image_url"], data["description"]
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+def save_cached_potd(date_iso, image_url, description):
+    """Cache the POTD image URL and description for the date."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{date_iso}.json"), "w") as f:
+            json.dump({"image_url": image_url, "description": description}, f)
+    except OSError as e:
+        print(f"Error caching POTD: {e}")
+
+def evict_cached_potd(date_iso):
+    """Remove cached metadata and images written before the date."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+
+    cutoff = date.fromisoformat(date_iso)
+    try:
+        for entry in os.scandir(CACHE_DIR):
+            if entry.is_file() and date.fromtimestamp(entry.stat().st_mtime) < cutoff:
+                os.remove(entry.path)
+    except OSError as e:
+        print(f"Error evicting cached POTD: {e}")
 
 def download_image(url):
-    """Download the image from the URL with retry capability."""
+    """
+    Download the image from the URL, retrying transient failures.
+    Returns None if the image could not be downloaded.
+    """
+    from PIL import Image
+
     if not url:
         print("Error: No URL provided")
-        return create_fallback_image()
-
-    max_retries = 3
-    retry_delay = 2  # seconds
+        return None
 
-    for attempt in range(max_retries):
+    # Reuse the image downloaded earlier today, if we have it. The file is
+    # named after a hash of the URL: percent-encoded names can exceed the
+    # file name limit, and MediaWiki shortens long ones to "thumbnail.<ext>"
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    cache_path = os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ext)
+    if os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
         try:
-            # Set a user agent to avoid blocking
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                print(f"Attempt {attempt+1}/{max_retries}: Failed to download image. Status code: {response.status_code}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    print("All download attempts failed. Using default image.")
-                    return create_fallback_image()
-
-            # Try to open the image content
-            try:
-                return Image.open(io.BytesIO(response.content))
-            except Exception as e:
-                print(f"Attempt {attempt+1}/{max_retries}: Error opening image: {e}")
-                if attempt < max_retries - 1:
-                    print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    print("Failed to open image after all attempts. Using default image.")
-                    return create_fallback_image()
-
+            return Image.open(cache_path)
         except Exception as e:
-            print(f"Attempt {attempt+1}/{max_retries}: Error downloading image: {e}")
-            if attempt < max_retries - 1:
-                print(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                print("All download attempts failed. Using default image.")
-                return create_fallback_image()
+            print(f"Error opening cached image: {e}")
 
-def create_fallback_image():
-    """Create a fallback image when download fails"""
+    # Stream the body straight into the cache file rather than holding the
+    # whole image in memory; Pillow then decodes lazily from disk
+    partial_path = cache_path + ".part"
     try:
-        # Try to download the Wikipedia logo as a fallback
-        default_img_url = "https://upload.wikimedia.org/wikipedia/commons/thumb/8/80/Wikipedia-logo-v2.svg/1200px-Wikipedia-logo-v2.svg.png"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-        }
-        default_response = requests.get(default_img_url, headers=headers)
-        return Image.open(io.BytesIO(default_response.content))
-    except Exception:
-        # Create a simple blank image as an absolute last resort
-        blank_img = Image.new('RGB', (800, 600), color='white')
-        draw = ImageDraw.Draw(blank_img)
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", 20)
-        except:
-            font = ImageFont.load_default()
-        draw.text((50, 50), "Failed to download Wikipedia Picture of the Day", fill='black', font=font)
-        return blank_img
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with SESSION.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(partial_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f)
+        os.replace(partial_path, cache_path)
+        return Image.open(cache_path)
+    except Exception as e:
+        print(f"Error downloading image: {e}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return None
+
+def create_fallback_image():
+    """
+    Create a fallback image when download fails. This is built locally, since
+    the usual cause is no network, where another download would fail too.
+    """
+    from PIL import Image, ImageDraw
+
+    blank_img = Image.new('RGB', (800, 600), color='white')
+    draw = ImageDraw.Draw(blank_img)
+    font, _ = load_fonts(20)
+    draw.text((50, 50), "Failed to download Wikipedia Picture of the Day", fill='black', font=font)
+    return blank_img
+
+def wrap_to_pixels(text, font, max_px):
+    """
+    Greedily wrap text into lines no wider than max_px pixels in the given
+    font. Each word is measured once and line widths are accumulated, so this
+    is linear in the number of words. Returns a list of (line, width) tuples.
+    """
+    measure = font.getlength
+    space_width = measure(' ')
+    lines = []
+    current_line = []
+    line_width = 0
+
+    for word in text.split():
+        word_width = measure(word)
+
+        # If adding this word exceeds max width, start a new line
+        if current_line and line_width + space_width + word_width > max_px:
+            lines.append((' '.join(current_line), line_width))
+            current_line = [word]
+            line_width = word_width
+        elif current_line:
+            current_line.append(word)
+            line_width += space_width + word_width
+        else:
+            current_line.append(word)
+            line_width = word_width
+
+    # Add the last line
+    if current_line:
+        lines.append((' '.join(current_line), line_width))
+
+    return lines
 
 def create_wallpaper(image, description):
     """
     Create a wallpaper with the image centered with a frame and description
     centered below it with equal borders and proper text alignment.
     """
+    from PIL import Image, ImageDraw
+
     # Get the screen resolution
     screen_size = get_screen_size()
 
@@ -267,8 +393,24 @@ def create_wallpaper(image, description):
         img_width = content_width
         img_height = int(img_width / img_aspect)
 
-    # Resize the image
-    resized_img = image.resize((img_width, img_height), Image.LANCZOS)
+    # Let libjpeg downscale while decoding (DCT scaling); this is a no-op for
+    # non-JPEG sources and keeps at least 2x the target size for LANCZOS
+    image.draft('RGB', (img_width * 2, img_height * 2))
+
+    # Drop alpha and palettes before resizing, so the filter runs over three
+    # channels and the paste below is a plain copy (after draft, so JPEGs
+    # still decode at reduced scale)
+    if image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    # Resize the image. Pillow antialiases every filter on downscale, so for
+    # mild reductions BILINEAR looks the same as LANCZOS at a fraction of the
+    # cost; larger reductions box-reduce first and finish with LANCZOS
+    ratio = img_width / image.width
+    if 0.5 <= ratio < 1:
+        resized_img = image.resize((img_width, img_height), Image.BILINEAR)
+    else:
+        resized_img = image.resize((img_width, img_height), Image.LANCZOS, reducing_gap=3.0)
 
     # Calculate position to center the image within the content area
     img_pos_x = border_size + ((content_width - img_width) // 2)
@@ -304,29 +446,8 @@ def create_wallpaper(image, description):
 
     # Add the description with proper text alignment
     # Try to find a suitable font
-    font_size = 22  # Slightly larger font for better readability
-    font_path = "/System/Library/Fonts/Supplemental/Arial.ttf"  # Default font path for macOS
-
-    # Try different system fonts if the default isn't available
-    if not os.path.exists(font_path):
-        font_paths = [
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Supplemental/Courier New.ttf"
-        ]
-        for path in font_paths:
-            if os.path.exists(path):
-                font_path = path
-                break
-
-    try:
-        font = ImageFont.truetype(font_path, font_size)
-        # Add a smaller font for longer descriptions
-        small_font = ImageFont.truetype(font_path, int(font_size * 0.85))
-    except IOError:
-        # Fall back to default font if TrueType font is not available
-        font = ImageFont.load_default()
-        small_font = font
+    font_size = FONT_SIZE
+    font, small_font = load_fonts(font_size)
 
     # Calculate text area dimensions
     text_area_width = content_width - 60  # 30px padding on each side
@@ -337,7 +458,7 @@ def create_wallpaper(image, description):
     # Clean up the description text
     description = description.strip()
     # Replace multiple spaces with single space
-    description = re.sub(r'\s+', ' ', description)
+    description = WHITESPACE_RE.sub(' ', description)
 
     # Determine if we need the smaller font for long descriptions
     if len(description) > 300:
@@ -345,47 +466,13 @@ def create_wallpaper(image, description):
     else:
         current_font = font
 
-    # Function to calculate optimal text wrapping
-    def get_wrapped_text(text, font, max_width):
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            # Add word to the current line
-            test_line = ' '.join(current_line + [word])
-            # Calculate width with given font
-            try:
-                left, top, right, bottom = draw.textbbox((0, 0), test_line, font=font)
-                text_width = right - left
-            except AttributeError:
-                # For older Pillow versions
-                try:
-                    text_width = draw.textlength(test_line, font=font)
-                except AttributeError:
-                    # Very old Pillow versions
-                    text_width = font.getsize(test_line)[0]
-
-            # If adding this word exceeds max width, start a new line
-            if text_width > max_width and current_line:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                current_line.append(word)
-
-        # Add the last line
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return lines
-
     # Get wrapped text lines
-    lines = get_wrapped_text(description, current_font, text_area_width)
+    lines = wrap_to_pixels(description, current_font, text_area_width)
 
     # If we have too many lines, try with smaller font
     if len(lines) * (font_size * 1.2) > text_area_height and current_font == font:
         current_font = small_font
-        lines = get_wrapped_text(description, current_font, text_area_width)
+        lines = wrap_to_pixels(description, current_font, text_area_width)
 
     # Calculate total text height
     line_height = int(current_font.size * 1.2)  # 1.2x line spacing
@@ -395,21 +482,9 @@ def create_wallpaper(image, description):
     start_y = text_area_y + (text_area_height - total_text_height) // 2
 
     # Draw each line centered horizontally
-    for i, line in enumerate(lines):
-        try:
-            # For newer Pillow versions
-            left, top, right, bottom = draw.textbbox((0, 0), line, font=current_font)
-            line_width = right - left
-        except AttributeError:
-            # For older Pillow versions
-            try:
-                line_width = draw.textlength(line, font=current_font)
-            except AttributeError:
-                # Very old Pillow versions
-                line_width = current_font.getsize(line)[0]
-
-        # Center this line
-        x = text_area_x + (text_area_width - line_width) // 2
+    for i, (line, line_width) in enumerate(lines):
+        # Center this line, using the width measured while wrapping
+        x = text_area_x + int(text_area_width - line_width) // 2
         y = start_y + (i * line_height)
 
         # Draw the text line
@@ -417,15 +492,45 @@ def create_wallpaper(image, description):
 
     return wallpaper
 
+@functools.lru_cache(maxsize=None)
+def load_fonts(font_size):
+    """
+    Load the system font at the given size, along with a smaller variant
+    for longer descriptions. Returns (font, small_font).
+    """
+    from PIL import ImageFont
+
+    try:
+        font = ImageFont.truetype(FONT_PATH, font_size)
+        # Add a smaller font for longer descriptions
+        small_font = ImageFont.truetype(FONT_PATH, int(font_size * 0.85))
+    except IOError:
+        # Fall back to default font if TrueType font is not available
+        font = ImageFont.load_default()
+        small_font = font
+
+    return font, small_font
+
+@functools.lru_cache(maxsize=1)
 def get_screen_size():
     """Get the screen resolution of the primary display."""
+    if Quartz is not None:
+        try:
+            # Use the mode's pixel size, which matches system_profiler on Retina displays
+            mode = Quartz.CGDisplayCopyDisplayMode(Quartz.CGMainDisplayID())
+            width = Quartz.CGDisplayModeGetPixelWidth(mode)
+            height = Quartz.CGDisplayModeGetPixelHeight(mode)
+            if width and height:
+                return (width, height)
+        except Exception as e:
+            print(f"Error getting screen size from Quartz: {e}")
+
     try:
         result = subprocess.run(['system_profiler', 'SPDisplaysDataType'], capture_output=True, text=True)
         output = result.stdout
 
         # Parse the output to find the resolution
-        resolution_pattern = r'Resolution: (\d+) x (\d+)'
-        match = re.search(resolution_pattern, output)
+        match = RESOLUTION_RE.search(output)
 
         if match:
             width = int(match.group(1))
@@ -439,6 +544,23 @@ def get_screen_size():
 
 def set_desktop_wallpaper(image_path):
     """Set the desktop wallpaper on all displays on macOS."""
+    if NSWorkspace is not None:
+        try:
+            url = NSURL.fileURLWithPath_(image_path)
+            workspace = NSWorkspace.sharedWorkspace()
+            success = True
+            for screen in NSScreen.screens():
+                ok, error = workspace.setDesktopImageURL_forScreen_options_error_(url, screen, {}, None)
+                if not ok:
+                    print(f"NSWorkspace method failed: {error}")
+                    success = False
+
+            if success:
+                print(f"Wallpaper set successfully on all displays: {image_path}")
+                return True
+        except Exception as e:
+            print(f"Error setting wallpaper with NSWorkspace: {e}")
+
     try:
         # This script sets the wallpaper on all displays
         script = f'''
@@ -489,8 +611,19 @@ def set_desktop_wallpaper(image_path):
 def format_description(description):
     """
     Format the description to ensure it fits well within the image.
+    Descriptions that are already short are returned without calling the API.
+    Returns the text and whether the API condensed it.
     """
+    if not description:
+        return description, False
+
+    description = description.strip()
+    if len(description) <= 120:
+        return description, False
+
     try:
+        from openai import OpenAI
+
         client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"),
     )
 
@@ -500,28 +633,64 @@ def format_description(description):
             input=description,
         )
 
-        return response.output_text
+        return response.output_text, True
 
     except Exception as e:
-        return description
+        return description, False
 
 def main():
     try:
-        print("Fetching Wikipedia Picture of the Day using API...")
-        img_url, description = fetch_potd()
+        # The POTD changes once a day, so reuse today's wallpaper if it exists
+        temp_dir = tempfile.gettempdir()
+        today = date.today().strftime("%Y-%m-%d")
+        wallpaper_path = os.path.join(temp_dir, f"wikipedia_potd_{today}.jpg")
 
-        description = format_description(description)
+        if os.path.exists(wallpaper_path) and os.path.getsize(wallpaper_path) > 0:
+            print(f"Using today's wallpaper from {wallpaper_path}")
+            if set_desktop_wallpaper(wallpaper_path):
+                print("Done! Wikipedia Picture of the Day set as your desktop wallpaper.")
+            return
 
-        if not img_url:
-            print("Failed to get the Picture of the Day. Using fallback image.")
-            image = create_fallback_image()
-            description = "Wikipedia Picture of the Day could not be retrieved."
-        else:
-            print(f"Image URL: {img_url}")
-            print(f"Description: {description[:100]}..." if len(description) > 100 else f"Description: {description}")
+        # Drop earlier days' metadata and images before caching today's
+        evict_cached_potd(today)
+
+        # The screen size picks the thumbnail width to download
+        screen_size = get_screen_size()
 
-            print("Downloading image...")
-            image = download_image(img_url)
+        # Load the fonts while the network requests run
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(load_fonts, FONT_SIZE)
+
+            img_url, description = load_cached_potd(today)
+            if img_url:
+                print("Using cached Wikipedia Picture of the Day")
+            else:
+                print("Fetching Wikipedia Picture of the Day using API...")
+                img_url, description = fetch_potd(width=screen_size[0])
+                # Never cache the placeholder caption; retry the fetch next run
+                if img_url and description != DEFAULT_DESCRIPTION:
+                    description, condensed = format_description(description)
+                    # Cache the condensed text so reruns skip the OpenAI call too,
+                    # but retry the call next run if it failed on a long description
+                    if condensed or len(description) <= 120:
+                        save_cached_potd(today, img_url, description)
+
+            image = None
+            if img_url:
+                print(f"Image URL: {img_url}")
+                print(f"Description: {description[:100]}..." if len(description) > 100 else f"Description: {description}")
+
+                print("Downloading image...")
+                image = download_image(img_url)
+
+            # Only a complete POTD may stand in for today's wallpaper on the next run
+            if image is None or description == DEFAULT_DESCRIPTION:
+                wallpaper_path = os.path.join(temp_dir, "wikipedia_potd_fallback.jpg")
+
+            if image is None:
+                print("Failed to get the Picture of the Day. Using fallback image.")
+                image = create_fallback_image()
+                description = "Wikipedia Picture of the Day could not be retrieved."
 
         print(f"Image dimensions: {image.width}x{image.height}")
 
@@ -529,11 +698,15 @@ def main():
         wallpaper = create_wallpaper(image, description)
 
         # Save the wallpaper to a temporary file
-        temp_dir = tempfile.gettempdir()
-        today = date.today().strftime("%Y-%m-%d")
-        wallpaper_path = os.path.join(temp_dir, f"wikipedia_potd_{today}.jpg")
-
-        wallpaper.save(wallpaper_path, "JPEG", quality=95)
+        # Viewed full-screen, 85 with 4:2:0 chroma is indistinguishable from 95.
+        # The file is written once and read once, so skip the extra encoder
+        # passes for optimized Huffman tables and progressive scans.
+        # Write to a partial file first, so a run killed mid-encode doesn't
+        # leave a truncated JPEG to be reused as today's wallpaper
+        partial_path = wallpaper_path + ".part"
+        wallpaper.save(partial_path, "JPEG", quality=85, subsampling=2,
+                       optimize=False, progressive=False)
+        os.replace(partial_path, wallpaper_path)
         print(f"Wallpaper saved to {wallpaper_path}")
 
         print("Setting as desktop wallpaper...")